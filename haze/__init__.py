@@ -1,5 +1,15 @@
 from .config import HazeConfig, load
 from .playlist import Track, Playlist, discover
-from .controller import Controller, State
 from .shuffle import ShuffleDeck
-from .tui import TUI
\ No newline at end of file
+
+# The controller and TUI pull in the audio and terminal stacks, so they are
+# imported on first access rather than with the package.
+_LAZY = {"Controller": ".controller", "State": ".controller", "TUI": ".tui"}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(module, __name__), name)
\ No newline at end of file
@@ -6,37 +6,39 @@ from typing import Optional
 
 import yaml
 
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutputSoundcardConfig:
     enabled: bool = True
     device: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransitionsConfig:
     default: str = "finish_track"
     crossfade_duration: float = 2.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayoutConfig:
     sample_rate: int = 48000
     channels: int = 2
     default_playlist: Optional[str] = None
     shuffle: bool = False
     shuffle_carry_over: int = 3
+    realtime: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebConfig:
     enabled: bool = True
     host: str = "0.0.0.0"
     port: int = 8080
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HazeConfig:
     playout: PlayoutConfig = field(default_factory=PlayoutConfig)
     soundcard: OutputSoundcardConfig = field(default_factory=OutputSoundcardConfig)
@@ -49,13 +51,21 @@ def load(path: Path = Path("config.yaml")) -> HazeConfig:
     raw: dict = {}
     if path.exists():
         with open(path, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+            raw = yaml.load(f, Loader=_Loader) or {}
+    return _build(raw)
 
-    playout_raw = raw.get("playout", {})
-    sc_raw = raw.get("outputs", {}).get("soundcard", {})
-    trans_raw = raw.get("transitions", {})
-    web_raw = raw.get("web", {})
-    paths_raw = raw.get("paths", {})
+
+_EMPTY: dict = {}
+
+
+def _build(raw: dict) -> HazeConfig:
+    get = raw.get
+    playout_raw = get("playout") or _EMPTY
+    outputs_raw = get("outputs") or _EMPTY
+    sc_raw = outputs_raw.get("soundcard") or _EMPTY
+    trans_raw = get("transitions") or _EMPTY
+    web_raw = get("web") or _EMPTY
+    paths_raw = get("paths") or _EMPTY
 
     return HazeConfig(
         playout=PlayoutConfig(
@@ -64,6 +74,7 @@ def load(path: Path = Path("config.yaml")) -> HazeConfig:
             default_playlist=playout_raw.get("default_playlist"),
             shuffle=playout_raw.get("shuffle", False),
             shuffle_carry_over=playout_raw.get("shuffle_carry_over", 3),
+            realtime=playout_raw.get("realtime", False),
         ),
         soundcard=OutputSoundcardConfig(
             enabled=sc_raw.get("enabled", True),
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import queue
 import subprocess
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
@@ -14,6 +17,7 @@ from .config import HazeConfig
 from .metadata import TrackMetadata, read as read_metadata
 from .playlist import Playlist, Track, discover
 from .shuffle import ShuffleDeck
+from .spsc import SPSCRing
 
 if TYPE_CHECKING:
     from .webserver import WebServer
@@ -21,6 +25,48 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 CHUNK_FRAMES = 2048
+RING_SLOTS = 12
+META_PREFETCH = 2
+# Entries carry embedded cover art, so keep the cache small and fixed rather
+# than sized to the playlist.
+META_CACHE_SIZE = 64
+PIPE_CHUNKS = 16
+NOW_PLAYING_PATH = Path("now_playing.txt")
+NOW_PLAYING_DEBOUNCE = 0.05
+BROADCAST_WINDOW = 0.03
+STOP_TIMEOUT = 2.0
+
+def _read_chunk(stream, buf: bytearray) -> int:
+    """Fill buf from an unbuffered stream; returns fewer bytes only at EOF."""
+    total = 0
+    size = len(buf)
+    with memoryview(buf) as view:
+        while total < size:
+            n = stream.readinto(view[total:])
+            if not n:
+                break
+            total += n
+    return total
+
+def _elevate_current_thread():
+    """Best effort: SCHED_FIFO if permitted, otherwise a lower nice value."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        return
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.nice(-10)
+    except (AttributeError, OSError) as e:
+        log.debug(f"Could not raise decoder priority: {e}")
+
+def _grow_pipe(stream, size: int):
+    """Best effort: let ffmpeg run further ahead of us before it blocks (Linux only)."""
+    try:
+        import fcntl
+        fcntl.fcntl(stream.fileno(), fcntl.F_SETPIPE_SZ, size)
+    except (ImportError, AttributeError, OSError) as e:
+        log.debug(f"Could not resize decoder pipe: {e}")
 
 class State(Enum):
     STOPPED = auto()
@@ -36,24 +82,63 @@ class Controller:
         self.active_playlist: Optional[Playlist] = None
         self._pending_playlist: Optional[Playlist] = None
         self._track_index: int = 0
+        self._n_tracks: int = 0
+        self._upcoming_cache: Optional[tuple[tuple, list[Track]]] = None
         self._shuffle: bool = cfg.playout.shuffle
         self._deck: Optional[ShuffleDeck] = None
         self.current_meta: TrackMetadata = TrackMetadata()
+        # Clear while the current track's art is being extracted and saved.
+        self.art_ready = threading.Event()
+        self._meta_cache: OrderedDict[tuple[str, int], TrackMetadata] = OrderedDict()
+        self._meta_lock = threading.Lock()
+        self._meta_pool = ThreadPoolExecutor(max_workers=META_PREFETCH, thread_name_prefix="haze-meta")
+        self._meta_futures: dict[str, Future[TrackMetadata]] = {}
         
         self.elapsed_seconds: float = 0.0
 
-        self._audio_queue: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=12)
+        # Decoder -> soundcard callback hand-off. Chunks are tagged with the
+        # generation they were decoded for; the callback (the only consumer)
+        # drops anything from an older generation after a track change.
+        self._chunk_size = CHUNK_FRAMES * cfg.playout.channels * 2
+        self._audio_ring = SPSCRing(RING_SLOTS, self._chunk_size)
+        self._generation: int = 0
         self._stop_decode = threading.Event()
-        self._pause_event = threading.Event()
-        self._pause_event.set()
+        # The decode loop reads _paused without locking; the condition is
+        # only taken to sleep while paused and to wake the decoder again.
+        self._paused: bool = False
+        self._pause_cv = threading.Condition()
+
+        self._ffmpeg_decode_prefix: tuple[str, ...] = (
+            "ffmpeg", "-loglevel", "error",
+            "-probesize", "32",
+            "-analyzeduration", "0",
+            "-i",
+        )
+        self._ffmpeg_decode_suffix: tuple[str, ...] = (
+            "-f", "s16le",
+            "-ar", str(cfg.playout.sample_rate),
+            "-ac", str(cfg.playout.channels),
+            "pipe:1",
+        )
 
         self._decode_thread: Optional[threading.Thread] = None
+        self._decode_proc: Optional[subprocess.Popen] = None
         self._sd_stream = None
 
+        self._now_playing_queue: queue.SimpleQueue[tuple[str, str, datetime]] = queue.SimpleQueue()
+        self._now_playing_thread: Optional[threading.Thread] = None
+
         self._webserver: Optional[WebServer] = None
+        self._ws_dirty = threading.Event()
+        self._ws_track_changed = False
+        # Guards _ws_track_changed together with _ws_dirty: a track change
+        # flagged while the broadcaster resets them must not be dropped.
+        self._ws_lock = threading.Lock()
+        self._broadcast_thread: Optional[threading.Thread] = None
         self._tui: Optional[object] = None
 
-        self._lock = threading.Lock()
+        self._cmd_q: queue.SimpleQueue[tuple] = queue.SimpleQueue()
+        self._control_thread: Optional[threading.Thread] = None
 
     @property
     def current_track(self) -> Optional[Track]:
@@ -73,93 +158,157 @@ class Controller:
 
     def start(self):
         self._start_outputs()
+        if self._now_playing_thread is None:
+            self._now_playing_thread = threading.Thread(target=self._now_playing_loop, daemon=True)
+            self._now_playing_thread.start()
+        if self._control_thread is None:
+            self._control_thread = threading.Thread(target=self._control_loop, daemon=True)
+            self._control_thread.start()
+        if self._broadcast_thread is None:
+            self._broadcast_thread = threading.Thread(target=self._broadcast_loop, daemon=True)
+            self._broadcast_thread.start()
         self.state = State.STOPPED
         default = self.cfg.playout.default_playlist
         if default and default in self.playlists:
-            self._activate(self.playlists[default])
+            self._cmd_q.put(("activate", self.playlists[default]))
         elif self.playlists:
-            self._activate(next(iter(self.playlists.values())))
+            self._cmd_q.put(("activate", next(iter(self.playlists.values()))))
 
     def stop(self):
-        self._stop_decode.set()
-        self._pause_event.set()
-        if self._decode_thread and self._decode_thread.is_alive():
-            self._decode_thread.join(timeout=1)
-        self._stop_outputs()
-        self.state = State.STOPPED
+        """Stops playback via the control thread and waits for it, so shutdown can rely on the decoder being gone."""
+        if self._control_thread is None:
+            self._stop()
+            return
+        done = threading.Event()
+        self._cmd_q.put(("stop", done))
+        if not done.wait(STOP_TIMEOUT):
+            log.warning("Control thread did not confirm stop")
 
     def pause(self):
-        if self.state == State.PLAYING:
-            self._pause_event.clear()
-            self.state = State.PAUSED
-            if self._webserver:
-                self._webserver.broadcast_state_change()
+        self._cmd_q.put(("pause",))
 
     def resume(self):
-        if self.state == State.PAUSED:
-            self._pause_event.set()
-            self.state = State.PLAYING
-            if self._webserver:
-                self._webserver.broadcast_state_change()
+        self._cmd_q.put(("resume",))
+
+    def _set_paused(self, paused: bool):
+        with self._pause_cv:
+            self._paused = paused
+            self._pause_cv.notify_all()
 
     def next_track(self):
-        with self._lock:
-            self._advance()
-            self._play_current()
+        self._cmd_q.put(("next",))
 
     def prev_track(self):
-        with self._lock:
-            self._rewind()
-            self._play_current()
+        self._cmd_q.put(("prev",))
 
     def toggle_shuffle(self):
+        self._cmd_q.put(("shuffle",))
+
+    def switch_to(self, name: str, immediate: bool = False):
+        if name in self.playlists:
+            self._cmd_q.put(("switch", name, immediate))
+
+    def reload_playlists(self):
+        self._cmd_q.put(("reload",))
+
+    def _control_loop(self):
+        """Applies queued operator commands one at a time; the only thread that changes the playout position."""
+        while True:
+            cmd = self._cmd_q.get()
+            op = cmd[0]
+            try:
+                if op == "next":
+                    self._advance()
+                    self._play_current()
+                elif op == "prev":
+                    self._rewind()
+                    self._play_current()
+                elif op == "shuffle":
+                    self._toggle_shuffle()
+                elif op == "switch":
+                    self._switch_to(cmd[1], cmd[2])
+                elif op == "reload":
+                    self._reload_playlists()
+                elif op == "activate":
+                    self._activate(cmd[1])
+                elif op == "stop":
+                    try:
+                        self._stop()
+                    finally:
+                        cmd[1].set()
+                elif op == "pause":
+                    self._pause()
+                elif op == "resume":
+                    self._resume()
+                elif op == "track_end":
+                    if cmd[1] == self._generation:
+                        self._next_internal()
+            except Exception as e:
+                log.error(f"Command {op!r} failed: {e}")
+
+    def _stop(self):
+        self._halt_decoder()
+        self._stop_outputs()
+        self.state = State.STOPPED
+        self._notify_change()
+
+    def _pause(self):
+        if self.state == State.PLAYING:
+            self._set_paused(True)
+            self.state = State.PAUSED
+            self._notify_change()
+
+    def _resume(self):
+        if self.state == State.PAUSED:
+            self._set_paused(False)
+            self.state = State.PLAYING
+            self._notify_change()
+
+    def _toggle_shuffle(self):
         self._shuffle = not self._shuffle
         self._rebuild_deck()
         log.info(f"Shuffle {'enabled' if self._shuffle else 'disabled'}")
-        if self._webserver:
-            self._webserver.broadcast_state_change()
+        self._notify_change()
 
-    def switch_to(self, name: str, immediate: bool = False):
+    def _switch_to(self, name: str, immediate: bool):
         if name not in self.playlists:
             return
         pl = self.playlists[name]
         transition = pl.transition or self.cfg.transitions.default
 
-        with self._lock:
-            if immediate or transition == "immediate" or self.active_playlist is None:
-                self._activate(pl)
-            else:
-                self._pending_playlist = pl
-                log.info(f"Queued switch to '{name}' ({transition})")
-                if self._webserver:
-                    self._webserver.broadcast_state_change()
+        if immediate or transition == "immediate" or self.active_playlist is None:
+            self._activate(pl)
+        else:
+            self._pending_playlist = pl
+            log.info(f"Queued switch to '{name}' ({transition})")
+            self._notify_change()
 
-    def reload_playlists(self):
+    def _reload_playlists(self):
         current_name = self.active_playlist.name if self.active_playlist else None
         self.load_playlists()
         if not current_name or current_name not in self.playlists:
             if self.playlists:
                 self._activate(next(iter(self.playlists.values())))
-        if self._webserver:
-            self._webserver.broadcast_state_change()
+        self._notify_change()
 
     def _current_index(self) -> int:
         if not self.active_playlist:
             return 0
         if self._shuffle and self._deck:
             return self._deck.current()
-        return self._track_index % len(self.active_playlist.tracks)
+        return self._track_index
 
     def _activate(self, pl: Playlist):
         self.active_playlist = pl
         self._track_index = 0
+        self._n_tracks = len(pl.tracks)
         self._rebuild_deck()
         self._play_current()
 
     def _rebuild_deck(self):
         if not self.active_playlist:
             return
-        n = len(self.active_playlist.tracks)
+        n = self._n_tracks
         if self._shuffle:
             self._deck = ShuffleDeck(n, carry_over=self.cfg.playout.shuffle_carry_over)
         else:
@@ -171,7 +320,8 @@ class Controller:
         if self._shuffle and self._deck:
             self._deck.advance()
         else:
-            self._track_index = (self._track_index + 1) % len(self.active_playlist.tracks)
+            i = self._track_index + 1
+            self._track_index = 0 if i >= self._n_tracks else i
 
     def _rewind(self):
         if not self.active_playlist:
@@ -179,115 +329,187 @@ class Controller:
         if self._shuffle and self._deck:
             self._deck.rewind()
         else:
-            self._track_index = (self._track_index - 1) % len(self.active_playlist.tracks)
+            i = self._track_index - 1
+            self._track_index = self._n_tracks - 1 if i < 0 else i
 
     def _play_current(self):
         """Kills existing decoder and starts a new one for the current track."""
         if not self.active_playlist or not self.active_playlist.tracks:
             return
 
-        self._stop_decode.set()
-        self._pause_event.set()
-        if self._decode_thread and self._decode_thread.is_alive():
-            if threading.current_thread() is not self._decode_thread:
-                self._decode_thread.join(timeout=1.0)
-
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._halt_decoder()
+        self._generation += 1
 
         track = self.current_track
         if not track:
             return
 
-        self.current_meta = read_metadata(track.path)
+        # Start the decoder first: spawning ffmpeg is the slowest step, and it
+        # can fill the ring while metadata is read and published below.
+        self.elapsed_seconds = 0.0
+        self._stop_decode.clear()
+        self.state = State.PLAYING
+
+        self._decode_thread = threading.Thread(
+            target=self._decode_loop,
+            args=(track.path_str, self._generation),
+            daemon=True,
+        )
+        self._decode_thread.start()
+
+        self.art_ready.clear()
+        pending = self._meta_futures.pop(track.path_str, None)
+        self.current_meta = pending.result() if pending else self._read_metadata(track)
         if self.current_meta.title: track.title = self.current_meta.title
         if self.current_meta.duration: track.duration = self.current_meta.duration
         self.current_meta.save_art()
+        self.art_ready.set()
         self._write_now_playing(track)
 
-
         log.info(f"Playing: {track}")
-        self.elapsed_seconds = 0.0
 
-        if self._webserver:
-            self._webserver.broadcast_track_change()
+        self._notify_change(track_change=True)
 
         if self._tui and hasattr(self._tui, "notify_track_start"):
             self._tui.notify_track_start()
 
-        self._stop_decode.clear()
-        self.state = State.PLAYING
-
-        self._decode_thread = threading.Thread(
-            target=self._decode_loop,
-            args=(track.path,),
-            daemon=True,
-        )
-        self._decode_thread.start()
-
-    def _decode_loop(self, path: Path):
-        bytes_per_sample = self.cfg.playout.channels * 2
-        chunk_size = CHUNK_FRAMES * bytes_per_sample
+        self._prefetch_metadata()
+
+    def upcoming(self, count: int) -> list[Track]:
+        """The next `count` tracks in play order, cached until the position or shuffle deck changes."""
+        key = (self._generation, self._deck, count)
+        cached = self._upcoming_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        pl = self.active_playlist
+        tracks = [pl.tracks[i] for i in self._upcoming_indices(count)] if pl else []
+        self._upcoming_cache = (key, tracks)
+        return tracks
+
+    def _upcoming_indices(self, count: int) -> list[int]:
+        pl = self.active_playlist
+        if not pl or not pl.tracks:
+            return []
+        if self._shuffle and self._deck:
+            return self._deck.peek(count)
+        n = self._n_tracks
+        idx = self._current_index()
+        return [i if i < n else i - n for i in range(idx + 1, idx + min(count + 1, n))]
+
+    def _prefetch_metadata(self):
+        """Reads metadata for the next few tracks in the background while the current one plays."""
+        tracks = self.active_playlist.tracks
+        futures: dict[str, Future[TrackMetadata]] = {}
+        for i in self._upcoming_indices(META_PREFETCH):
+            track = tracks[i]
+            key = track.path_str
+            futures[key] = self._meta_futures.get(key) or self._meta_pool.submit(self._read_metadata, track)
+        self._meta_futures = futures
+
+    def _read_metadata(self, track: Track) -> TrackMetadata:
+        """read_metadata() memoized on (path, mtime) so looping playlists skip the mutagen parse."""
+        path = track.path
+        try:
+            key = (track.path_str, os.stat(track.path_str).st_mtime_ns)
+        except OSError:
+            return read_metadata(path)
+
+        with self._meta_lock:
+            meta = self._meta_cache.get(key)
+            if meta is not None:
+                self._meta_cache.move_to_end(key)
+                return meta
+
+        meta = read_metadata(path)
+
+        with self._meta_lock:
+            self._meta_cache[key] = meta
+            while len(self._meta_cache) > META_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+        return meta
+
+    def _halt_decoder(self):
+        """Stops the decoder thread and its ffmpeg; the ring must only ever have one producer."""
+        self._stop_decode.set()
+        self._set_paused(False)
+        # Killing ffmpeg unblocks a read stuck on a stalled source, so the
+        # join below doesn't time out on it.
+        proc = self._decode_proc
+        if proc is not None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+        decoder = self._decode_thread
+        if decoder is not None and decoder.is_alive():
+            decoder.join(timeout=1.0)
+            if decoder.is_alive():
+                log.warning("Decoder thread did not exit; it will stop at its next generation check")
+
+    def _decode_loop(self, path: str, gen: int):
+        ring = self._audio_ring
         frame_duration = CHUNK_FRAMES / self.cfg.playout.sample_rate
 
         proc = subprocess.Popen(
-            [
-                "ffmpeg", "-loglevel", "error",
-                "-probesize", "32",
-                "-analyzeduration", "0",
-                "-i", str(path),
-                "-f", "s16le",
-                "-ar", str(self.cfg.playout.sample_rate),
-                "-ac", str(self.cfg.playout.channels),
-                "pipe:1",
-            ],
+            self._ffmpeg_decode_prefix + (path,) + self._ffmpeg_decode_suffix,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
+            bufsize=0,
         )
-
+        if gen == self._generation:
+            self._decode_proc = proc
+        _grow_pipe(proc.stdout, PIPE_CHUNKS * self._chunk_size)
+        # Raised only after the spawn so ffmpeg doesn't inherit it: a
+        # CPU-bound decoder at real-time priority would starve the box. Only
+        # this reader, which hands chunks to the audio callback, needs it.
+        if self.cfg.playout.realtime:
+            _elevate_current_thread()
+
+        # A decoder that outlived _halt_decoder() sees the generation move on
+        # and exits without touching the ring again.
         try:
-            while not self._stop_decode.is_set():
-                self._pause_event.wait()
-                if self._stop_decode.is_set():
-                    break
+            while not self._stop_decode.is_set() and gen == self._generation:
+                if self._paused:
+                    with self._pause_cv:
+                        self._pause_cv.wait_for(lambda: not self._paused or self._stop_decode.is_set())
+                    if self._stop_decode.is_set():
+                        break
                 
-                chunk = proc.stdout.read(chunk_size)
-                if not chunk:
+                slot = ring.reserve()
+                while slot is None and not self._stop_decode.wait(frame_duration / 2):
+                    if gen != self._generation:
+                        break
+                    slot = ring.reserve()
+                if slot is None:
                     break
-                
-                try:
 
-                    self._audio_queue.put(chunk, timeout=0.5)
-                    self.elapsed_seconds += frame_duration
-                except queue.Full:
-                    continue
+                n = _read_chunk(proc.stdout, slot)
+                if not n or gen != self._generation:
+                    break
+                ring.publish(n, gen)
+                self.elapsed_seconds += frame_duration
 
             if not self._stop_decode.is_set():
-                while not self._audio_queue.empty() and not self._stop_decode.is_set():
+                while not ring.empty() and not self._stop_decode.is_set() and gen == self._generation:
                     time.sleep(0.1)
 
         finally:
             proc.kill()
             proc.wait()
+            if self._decode_proc is proc:
+                self._decode_proc = None
 
-        if not self._stop_decode.is_set():
-            self._on_track_end()
-
-    def _on_track_end(self):
-        threading.Thread(target=self._next_internal, daemon=True).start()
+        if not self._stop_decode.is_set() and gen == self._generation:
+            self._cmd_q.put(("track_end", gen))
 
     def _next_internal(self):
-        with self._lock:
-            if self._pending_playlist is not None:
-                pl = self._pending_playlist
-                self._pending_playlist = None
-                self._activate(pl)
-            else:
-                self._advance()
-                self._play_current()
+        if self._pending_playlist is not None:
+            pl = self._pending_playlist
+            self._pending_playlist = None
+            self._activate(pl)
+        else:
+            self._advance()
+            self._play_current()
 
     def _start_outputs(self):
         if self.cfg.soundcard.enabled:
@@ -299,16 +521,30 @@ class Controller:
             import numpy as np
             sr = self.cfg.playout.sample_rate
             ch = self.cfg.playout.channels
-            
+            scale = np.float32(1.0 / 32768.0)
+
             def callback(outdata, frames, time_info, status):
+                ring = self._audio_ring
+                item = ring.peek()
+                while item is not None and item[2] != self._generation:
+                    ring.release()
+                    item = ring.peek()
+                if item is None:
+                    outdata.fill(0)
+                    return
                 try:
-                    chunk = self._audio_queue.get_nowait()
-                    if len(chunk) < (frames * ch * 2):
-                        chunk = chunk.ljust(frames * ch * 2, b"\x00")
-                    pcm = np.frombuffer(chunk, dtype=np.int16)
-                    outdata[:] = pcm.reshape(-1, ch).astype(np.float32) / 32768.0
-                except (queue.Empty, TypeError):
+                    slot, size, _ = item
+                    pcm = np.frombuffer(slot, dtype=np.int16, count=size // 2).reshape(-1, ch)
+                    n = len(pcm)
+                    np.multiply(pcm, scale, out=outdata[:n])
+                    if n < frames:
+                        # Short final chunk: zero the tail in place rather
+                        # than padding a new bytes object.
+                        outdata[n:].fill(0)
+                except (ValueError, TypeError):
                     outdata.fill(0)
+                finally:
+                    ring.release()
 
             self._sd_stream = sd.OutputStream(
                 samplerate=sr, channels=ch, dtype="float32",
@@ -329,9 +565,56 @@ class Controller:
             self._sd_stream.close()
             self._sd_stream = None
 
+    def _notify_change(self, track_change: bool = False):
+        if self._tui and hasattr(self._tui, "mark_dirty"):
+            self._tui.mark_dirty()
+        if self._webserver:
+            self._webserver.invalidate_state()
+            with self._ws_lock:
+                if track_change:
+                    self._ws_track_changed = True
+                self._ws_dirty.set()
+
+    def _broadcast_loop(self):
+        """Sends at most one websocket update per BROADCAST_WINDOW, however many changes land in it."""
+        while True:
+            self._ws_dirty.wait()
+            time.sleep(BROADCAST_WINDOW)
+            with self._ws_lock:
+                self._ws_dirty.clear()
+                track_change, self._ws_track_changed = self._ws_track_changed, False
+            ws = self._webserver
+            if not ws:
+                continue
+            # A track change carries the full state too, so it supersedes any
+            # plain state updates in the same window.
+            try:
+                if track_change:
+                    ws.broadcast_track_change()
+                else:
+                    ws.broadcast_state_change()
+            except Exception as e:
+                log.error(f"Web broadcast failed: {e}")
+
     def _write_now_playing(self, track: Track):
-        try:
-            meta = self.current_meta
-            lines = [f"title={meta.title or track.path.stem}", f"artist={meta.artist or ''}", f"timestamp={datetime.now().isoformat()}"]
-            Path("now_playing.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
-        except Exception: pass
\ No newline at end of file
+        meta = self.current_meta
+        self._now_playing_queue.put((meta.title or track.path.stem, meta.artist or "", datetime.now()))
+
+    def _now_playing_loop(self):
+        """Writes now_playing.txt off the track-change path; readers only ever see a complete file."""
+        tmp = NOW_PLAYING_PATH.with_name(NOW_PLAYING_PATH.name + ".tmp")
+        while True:
+            entry = self._now_playing_queue.get()
+            # Coalesce bursts (e.g. rapid skips) into a single write of the
+            # latest track.
+            while True:
+                try:
+                    entry = self._now_playing_queue.get(timeout=NOW_PLAYING_DEBOUNCE)
+                except queue.Empty:
+                    break
+            title, artist, started = entry
+            try:
+                tmp.write_text(f"title={title}\nartist={artist}\ntimestamp={started.isoformat()}\n", encoding="utf-8")
+                os.replace(tmp, NOW_PLAYING_PATH)
+            except Exception as e:
+                log.debug(f"Could not write now playing: {e}")
\ No newline at end of file
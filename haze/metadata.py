@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import importlib
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -9,6 +11,26 @@ log = logging.getLogger(__name__)
 
 ART_CACHE_PATH = Path("now_playing_art.jpg")
 
+# path -> art bytes last written there (None once removed), so consecutive
+# tracks sharing cover art don't rewrite the file.
+_saved_art: dict[Path, Optional[bytes]] = {}
+
+# Suffix -> (module, class) of the mutagen reader for that container. Opening
+# the right class directly skips MutagenFile's score-every-format sniffing.
+_READERS: dict[str, tuple[str, str]] = {
+    ".mp3": ("mutagen.mp3", "MP3"),
+    ".flac": ("mutagen.flac", "FLAC"),
+    ".ogg": ("mutagen.oggvorbis", "OggVorbis"),
+    ".opus": ("mutagen.oggopus", "OggOpus"),
+    ".m4a": ("mutagen.mp4", "MP4"),
+    ".mp4": ("mutagen.mp4", "MP4"),
+    ".alac": ("mutagen.mp4", "MP4"),
+    ".wma": ("mutagen.asf", "ASF"),
+    ".wav": ("mutagen.wave", "WAVE"),
+    ".aiff": ("mutagen.aiff", "AIFF"),
+    ".aif": ("mutagen.aiff", "AIFF"),
+}
+
 
 @dataclass
 class TrackMetadata:
@@ -32,16 +54,23 @@ class TrackMetadata:
         return bool(self.art)
 
     def save_art(self, path: Path = ART_CACHE_PATH):
-        if self.art:
+        art = self.art or None
+        if path in _saved_art and _saved_art[path] == art:
+            return
+        if art:
             try:
-                path.write_bytes(self.art)
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(art)
+                os.replace(tmp, path)
             except Exception as e:
                 log.debug(f"Could not save art: {e}")
+                return
         else:
             try:
                 path.unlink(missing_ok=True)
             except Exception:
-                pass
+                return
+        _saved_art[path] = art
 
     def art_as_base64(self) -> Optional[str]:
         if not self.art:
@@ -68,8 +97,12 @@ def read(path: Path) -> TrackMetadata:
         log.warning("mutagen not installed — run: pip install mutagen")
         return TrackMetadata()
 
+    suffix = path.suffix.lower()
+
     try:
-        f = MutagenFile(path, easy=False)
+        f = _open_specialized(path, suffix)
+        if f is None:
+            f = MutagenFile(path, easy=False)
     except Exception as e:
         log.debug(f"mutagen could not read {path.name}: {e}")
         return TrackMetadata()
@@ -82,24 +115,20 @@ def read(path: Path) -> TrackMetadata:
     if f.info and hasattr(f.info, "length"):
         meta.duration = f.info.length
 
-    suffix = path.suffix.lower()
+    _TAG_READERS.get(suffix, _read_generic)(f, meta)
+    return meta
 
-    if suffix == ".mp3":
-        _read_id3(f, meta)
-    elif suffix == ".flac":
-        _read_flac(f, meta)
-    elif suffix in {".ogg", ".opus"}:
-        _read_vorbis(f, meta)
-    elif suffix in {".m4a", ".aac", ".alac", ".mp4"}:
-        _read_mp4(f, meta)
-    elif suffix == ".wma":
-        _read_asf(f, meta)
-    elif suffix in {".wav", ".aiff", ".aif"}:
-        _read_id3(f, meta)
-    else:
-        _read_generic(f, meta)
 
-    return meta
+def _open_specialized(path: Path, suffix: str):
+    spec = _READERS.get(suffix)
+    if spec is None:
+        return None
+    try:
+        return getattr(importlib.import_module(spec[0]), spec[1])(path)
+    except Exception:
+        # Content doesn't match the extension (e.g. Opus in a .ogg); let
+        # MutagenFile sniff it instead.
+        return None
 
 
 def _first(values) -> Optional[str]:
@@ -221,4 +250,20 @@ def _read_generic(f, meta: TrackMetadata):
     if isinstance(tags, dict):
         meta.title = _first(tags.get("title") or tags.get("TIT2"))
         meta.artist = _first(tags.get("artist") or tags.get("TPE1"))
-        meta.album = _first(tags.get("album") or tags.get("TALB"))
\ No newline at end of file
+        meta.album = _first(tags.get("album") or tags.get("TALB"))
+
+
+_TAG_READERS = {
+    ".mp3": _read_id3,
+    ".flac": _read_flac,
+    ".ogg": _read_vorbis,
+    ".opus": _read_vorbis,
+    ".m4a": _read_mp4,
+    ".aac": _read_mp4,
+    ".alac": _read_mp4,
+    ".mp4": _read_mp4,
+    ".wma": _read_asf,
+    ".wav": _read_id3,
+    ".aiff": _read_id3,
+    ".aif": _read_id3,
+}
\ No newline at end of file
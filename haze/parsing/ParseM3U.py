@@ -1,21 +1,24 @@
+import os
 from pathlib import Path
 from typing import Optional
 
+from .common import keep_existing
+
 
 def parse(path: Path) -> list[dict]:
     tracks = []
-    base = path.parent
+    base = os.path.abspath(path.parent)
     current_title: Optional[str] = None
     current_duration: Optional[float] = None
 
-    with open(path, encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        line = raw.strip()
 
-            if not line or line.startswith("#EXTM3U"):
-                continue
+        if not line:
+            continue
 
-            if line.startswith("#EXTINF:"):
+        if line[0] == "#":
+            if line[:8] == "#EXTINF:":
                 rest = line[8:]
                 parts = rest.split(",", 1)
                 try:
@@ -23,25 +26,17 @@ def parse(path: Path) -> list[dict]:
                 except (ValueError, IndexError):
                     current_duration = None
                 current_title = parts[1].strip() if len(parts) > 1 else None
-                continue
-
-            if line.startswith("#"):
-                continue
-
-            track_path = Path(line)
-            if not track_path.is_absolute():
-                track_path = base / track_path
-
-            track_path = track_path.resolve()
+            continue
 
-            if track_path.exists():
-                tracks.append({
-                    "path": track_path,
-                    "title": current_title,
-                    "duration": current_duration,
-                })
+        # Absolute entries replace base in join(); normpath is enough here,
+        # playback does not need symlinks resolved.
+        tracks.append({
+            "path": os.path.normpath(os.path.join(base, line)),
+            "title": current_title,
+            "duration": current_duration,
+        })
 
-            current_title = None
-            current_duration = None
+        current_title = None
+        current_duration = None
 
-    return tracks
\ No newline at end of file
+    return keep_existing(tracks)
\ No newline at end of file
@@ -1,37 +1,40 @@
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional
 from urllib.parse import unquote
 
+from .common import keep_existing
+
 
 _NS = "http://xspf.org/ns/0/"
+_TRACK_TAG = f"{{{_NS}}}track"
+_LOCATION_TAG = f"{{{_NS}}}location"
+_TITLE_TAG = f"{{{_NS}}}title"
+_DURATION_TAG = f"{{{_NS}}}duration"
 
 
-def _resolve_location(location: str, base: Path) -> Path:
+def _resolve_location(location: str, base: str) -> str:
     if location.startswith("file:///"):
-        return Path(unquote(location[8:]))
+        return unquote(location[8:])
     if location.startswith("file://"):
-        return Path(unquote(location[7:]))
-    p = Path(unquote(location))
-    if not p.is_absolute():
-        p = base / p
-    return p.resolve()
+        return unquote(location[7:])
+    return os.path.normpath(os.path.join(base, unquote(location)))
 
 
 def parse(path: Path) -> list[dict]:
     tracks = []
-    base = path.parent
-
-    tree = ET.parse(path)
-    root = tree.getroot()
+    base = os.path.abspath(path.parent)
 
-    def _tag(name: str) -> str:
-        return f"{{{_NS}}}{name}"
-
-    for track_elem in root.iter(_tag("track")):
-        location = track_elem.findtext(_tag("location"))
-        title = track_elem.findtext(_tag("title"))
-        duration_ms = track_elem.findtext(_tag("duration"))
+    # Stream the document and drop each <track> once handled, rather than
+    # building the whole tree first.
+    for _, track_elem in ET.iterparse(path, events=("end",)):
+        if track_elem.tag != _TRACK_TAG:
+            continue
+        location = track_elem.findtext(_LOCATION_TAG)
+        title = track_elem.findtext(_TITLE_TAG)
+        duration_ms = track_elem.findtext(_DURATION_TAG)
+        track_elem.clear()
 
         if not location:
             continue
@@ -45,11 +48,10 @@ def parse(path: Path) -> list[dict]:
             except ValueError:
                 pass
 
-        if track_path.exists():
-            tracks.append({
-                "path": track_path,
-                "title": title,
-                "duration": duration,
-            })
+        tracks.append({
+            "path": track_path,
+            "title": title,
+            "duration": duration,
+        })
 
-    return tracks
\ No newline at end of file
+    return keep_existing(tracks)
\ No newline at end of file
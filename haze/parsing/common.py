@@ -0,0 +1,28 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Below this many entries a thread pool costs more than it saves.
+_PARALLEL_STAT_MIN = 64
+_STAT_WORKERS = 16
+
+
+def keep_existing(entries: list[dict]) -> list[dict]:
+    """Drops entries whose "path" (a str) does not exist and converts the rest to Path.
+
+    Large playlists are stat'ed from a thread pool, which helps when the
+    files live on network or spinning storage.
+    """
+    paths = [e["path"] for e in entries]
+    if len(paths) < _PARALLEL_STAT_MIN:
+        found = list(map(os.path.exists, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as pool:
+            found = list(pool.map(os.path.exists, paths))
+
+    kept = []
+    for entry, ok in zip(entries, found):
+        if ok:
+            entry["path"] = Path(entry["path"])
+            kept.append(entry)
+    return kept
\ No newline at end of file
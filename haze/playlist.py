@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -17,12 +19,21 @@ PLAYLIST_EXTENSIONS: frozenset[str] = frozenset({
     ".m3u", ".m3u8", ".xspf",
 })
 
+# str.endswith() takes a tuple and scans it in C, which beats splitext() plus
+# a set lookup in the per-entry scan loops.
+_AUDIO_SUFFIXES: tuple[str, ...] = tuple(AUDIO_EXTENSIONS)
+_PLAYLIST_SUFFIXES: tuple[str, ...] = tuple(PLAYLIST_EXTENSIONS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Track:
     path: Path
     title: Optional[str] = None
     duration: Optional[float] = None
+    path_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.path_str = os.fspath(self.path)
 
     def __str__(self) -> str:
         return self.title or self.path.stem
@@ -57,12 +68,39 @@ def _tracks_from_dicts(raw: list[dict]) -> list[Track]:
     ]
 
 
+# resolved directory -> (st_mtime_ns, track paths). A directory's mtime
+# changes whenever an entry is added, removed or renamed, so an unchanged
+# mtime means the listing can be reused on reload. Only paths are kept: the
+# controller fills in titles and durations on the Track objects it plays.
+_folder_cache: dict[str, tuple[int, tuple[Path, ...]]] = {}
+
+# Timestamps are coarse on some file systems (2 s on FAT32, similar on some
+# network mounts), so a file added in the same tick as a scan leaves the
+# mtime unchanged. Like git's "racy" index entries, a listing is only cached
+# once its directory mtime is this far behind the scan.
+_RACY_NS = 3_000_000_000
+
+
 def _scan_folder(directory: Path) -> list[Track]:
-    return [
-        Track(path=p.resolve())
-        for p in sorted(directory.iterdir())
-        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
-    ]
+    root = os.path.realpath(directory)
+    mtime = os.stat(root).st_mtime_ns
+    cached = _folder_cache.get(root)
+    if cached and cached[0] == mtime:
+        return [Track(path=p) for p in cached[1]]
+
+    # normcase keeps the old Path ordering: case-insensitive on Windows only.
+    with os.scandir(root) as it:
+        names = sorted(
+            (e.name for e in it
+             if e.name.lower().endswith(_AUDIO_SUFFIXES) and e.is_file()),
+            key=os.path.normcase,
+        )
+    paths = tuple(Path(root, name) for name in names)
+    if time.time_ns() - mtime >= _RACY_NS:
+        _folder_cache[root] = (mtime, paths)
+    else:
+        _folder_cache.pop(root, None)
+    return [Track(path=p) for p in paths]
 
 
 def discover(cfg: HazeConfig) -> dict[str, Playlist]:
@@ -85,8 +123,12 @@ def discover(cfg: HazeConfig) -> dict[str, Playlist]:
             source_path=root,
         )
 
-    for entry in sorted(root.iterdir()):
-        if entry.is_dir():
+    with os.scandir(root) as it:
+        dir_entries = sorted(it, key=lambda e: os.path.normcase(e.name))
+
+    for d in dir_entries:
+        if d.is_dir():
+            entry = Path(d.path)
             tracks = _scan_folder(entry)
             if tracks:
                 pl = Playlist(
@@ -98,7 +140,8 @@ def discover(cfg: HazeConfig) -> dict[str, Playlist]:
                 )
                 playlists[pl.name] = pl
 
-        elif entry.is_file() and entry.suffix.lower() in PLAYLIST_EXTENSIONS:
+        elif d.name.lower().endswith(_PLAYLIST_SUFFIXES) and d.is_file():
+            entry = Path(d.path)
             try:
                 raw = parse_playlist_file(entry)
             except Exception:
@@ -9,26 +9,36 @@ class ShuffleDeck:
         self._carry_over = min(carry_over, n // 2)
         self._deck: list[int] = []
         self._pos: int = 0
-        self._last_tail: list[int] = []
+        self._last_tail: set[int] = set()
         self._build()
 
     def _build(self):
         deck = list(range(self._n))
-        random.shuffle(deck)
-
-        if self._last_tail:
-            for i, idx in enumerate(deck):
-                if idx not in self._last_tail:
-                    deck[0], deck[i] = deck[i], deck[0]
-                    break
-
-        self._last_tail = deck[-self._carry_over:] if self._carry_over else []
+        tail = self._last_tail
+        if tail:
+            # Draw the opening track from outside the previous tail and
+            # shuffle only the rest. The tail is at most half the deck, so
+            # this takes two draws on average.
+            head = random.randrange(self._n)
+            while head in tail:
+                head = random.randrange(self._n)
+            deck[0], deck[head] = head, 0
+            rest = deck[1:]
+            random.shuffle(rest)
+            deck[1:] = rest
+        else:
+            random.shuffle(deck)
+
+        self._last_tail = set(deck[-self._carry_over:]) if self._carry_over else set()
         self._deck = deck
         self._pos = 0
 
     def current(self) -> int:
         return self._deck[self._pos]
 
+    def peek(self, count: int) -> list[int]:
+        return self._deck[self._pos + 1:self._pos + 1 + count]
+
     def advance(self):
         self._pos += 1
         if self._pos >= self._n:
@@ -41,5 +51,5 @@ class ShuffleDeck:
         if n is not None:
             self._n = n
             self._carry_over = min(self._carry_over, n // 2)
-            self._last_tail = []
+            self._last_tail = set()
         self._build()
\ No newline at end of file
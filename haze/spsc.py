@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+class SPSCRing:
+    """Single-producer/single-consumer ring of preallocated PCM slots.
+
+    The producer fills a slot in place (`reserve` then `publish`) and the
+    consumer reads it in place (`peek` then `release`), so chunks are never
+    allocated or copied on the way through. `_tail` is only written by the
+    producer and `_head` only by the consumer; both only ever increase, so
+    under the GIL neither side needs a lock. Do not share an end between
+    threads.
+    """
+
+    def __init__(self, capacity: int, slot_size: int):
+        self._capacity = capacity
+        self._slots = [bytearray(slot_size) for _ in range(capacity)]
+        self._lengths = [0] * capacity
+        self._tags = [0] * capacity
+        self._head = 0
+        self._tail = 0
+
+    def reserve(self) -> Optional[bytearray]:
+        """Returns the next free slot for the producer to fill, or None if full."""
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            return None
+        return self._slots[tail % self._capacity]
+
+    def publish(self, length: int, tag: int = 0):
+        """Hands the reserved slot to the consumer."""
+        i = self._tail % self._capacity
+        self._lengths[i] = length
+        self._tags[i] = tag
+        self._tail += 1
+
+    def peek(self) -> Optional[tuple[bytearray, int, int]]:
+        """Returns (slot, length, tag) of the oldest published slot, or None if empty."""
+        head = self._head
+        if head == self._tail:
+            return None
+        i = head % self._capacity
+        return self._slots[i], self._lengths[i], self._tags[i]
+
+    def release(self):
+        """Returns the slot from the last peek() to the producer."""
+        self._head += 1
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def __len__(self) -> int:
+        return self._tail - self._head
\ No newline at end of file
@@ -5,6 +5,7 @@ import sys
 import threading
 import time
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,10 +21,17 @@ _USE_CURSES = sys.platform != "win32"
 def _fmt_time(secs: float | None) -> str:
     if secs is None:
         return "--:--"
-    secs = int(secs)
+    return _fmt_secs(int(secs))
+
+
+# The draw paths format and truncate the same handful of values every
+# frame, so both are memoised.
+@lru_cache(maxsize=4096)
+def _fmt_secs(secs: int) -> str:
     return f"{secs // 60}:{secs % 60:02d}"
 
 
+@lru_cache(maxsize=256)
 def _trunc(s: str, n: int) -> str:
     s = s or ""
     return s if len(s) <= n else s[:max(0, n - 1)] + "…"
@@ -40,7 +48,12 @@ def _progress_bar(elapsed: float, total: float | None, width: int) -> str:
     if inner < 4:
         return f"[{time_str.strip()}]"
     filled = int(inner * min(elapsed, total) / total) if (total and total > 0) else 0
-    return "[" + "=" * filled + " " * (inner - filled) + time_str + "]"
+    return _bar_body(filled, inner) + time_str + "]"
+
+
+@lru_cache(maxsize=256)
+def _bar_body(filled: int, inner: int) -> str:
+    return "[" + "=" * filled + " " * (inner - filled)
 
 
 def _cols() -> int:
@@ -50,6 +63,96 @@ def _cols() -> int:
         return 80
 
 
+def _enable_vt():
+    """Turns on ANSI escape handling for this console (Windows 10+)."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception as e:
+        log.debug(f"Could not enable VT mode: {e}")
+
+
+def _flush_rows(scr, rows: list, prev: list) -> bool:
+    """Rewrites only the rows whose spans differ from the previous frame; true if any did."""
+    import curses
+    changed = False
+    for y, spans in enumerate(rows):
+        if spans == prev[y]:
+            continue
+        changed = True
+        try:
+            scr.move(y, 0)
+            scr.clrtoeol()
+            for x, text, attr in spans:
+                scr.addnstr(y, x, text, len(text), attr)
+        except curses.error:
+            # Only reachable when wide glyphs overflow the last column.
+            pass
+    return changed
+
+
+def _console_input_waiter(msvcrt):
+    """Returns a callable that blocks until console input is pending, instead of polling kbhit()."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+    except Exception as e:
+        log.debug(f"Could not wait on console input: {e}")
+        return lambda: time.sleep(0.05)
+
+    record = (ctypes.c_byte * 20)()  # one INPUT_RECORD
+    read = wintypes.DWORD()
+
+    def wait():
+        if kernel32.WaitForSingleObject(handle, 250) != 0:  # WAIT_OBJECT_0
+            return
+        # The handle also signals for key-ups, mouse and focus events, which
+        # kbhit() ignores but leaves queued. Drop one so we don't spin on it.
+        if not msvcrt.kbhit():
+            kernel32.ReadConsoleInputW(handle, record, 1, ctypes.byref(read))
+
+    return wait
+
+
+_colors_ready = False
+
+
+def _init_colors() -> dict[str, int]:
+    """Sets up the colour pairs once per process and returns the draw attributes by role."""
+    global _colors_ready
+    import curses
+    if not _colors_ready:
+        curses.start_color()
+        curses.use_default_colors()
+        curses.init_pair(1, curses.COLOR_CYAN,    -1)
+        curses.init_pair(2, curses.COLOR_GREEN,   -1)
+        curses.init_pair(3, curses.COLOR_YELLOW,  -1)
+        curses.init_pair(4, curses.COLOR_MAGENTA, -1)
+        curses.init_pair(5, curses.COLOR_WHITE,   -1)
+        _colors_ready = True
+    return {
+        "header":       curses.color_pair(1) | curses.A_BOLD,
+        "progress":     curses.color_pair(1),
+        "title":        curses.color_pair(2) | curses.A_BOLD,
+        "section":      curses.color_pair(3) | curses.A_BOLD,
+        "label":        curses.color_pair(3),
+        "album":        curses.color_pair(4),
+        "text":         curses.color_pair(5),
+        "table_header": curses.color_pair(5) | curses.A_UNDERLINE,
+    }
+
+
+# Frame caps: smooth progress while playing, next to nothing otherwise. A
+# frame is only drawn when something changed or the clock ticked over.
+FPS_PLAYING = 30
+FPS_IDLE = 5
+
 HELP = "[ 1 ] PLAY  [ 2 ] PAUSE  [ 3 ] STOP  [ 4 ] NEXT  [ 5 ] PREV  [ 6 ] SHUFFLE  [ 7 ] RELOAD  [ Q ] QUIT"
 DIV = "─"
 
@@ -84,10 +187,37 @@ class TUI:
         self._running = False
         self._elapsed: float = 0.0
         self._track_start: float | None = None
+        self._screen_size: tuple[int, int] = (0, 0)
+        self._prev_rows: list[list[tuple[int, str, int]]] = []
+        self._prev_lines: list[str] = []
+        self._prev_width: int = 0
+        self._attr: dict[str, int] = {}
+        self._dirty = threading.Event()
+        self._dirty.set()
+        self._drawn_second: int = -1
 
     def notify_track_start(self):
         self._track_start = time.monotonic()
         self._elapsed = 0.0
+        self._dirty.set()
+
+    def mark_dirty(self):
+        self._dirty.set()
+
+    def _should_draw(self) -> bool:
+        """Consumes the dirty flag; true if the screen needs repainting."""
+        self._update_elapsed()
+        second = int(self._elapsed)
+        if not self._dirty.is_set() and second == self._drawn_second:
+            return False
+        # Cleared before drawing so a change made mid-draw gets its own frame.
+        self._dirty.clear()
+        self._drawn_second = second
+        return True
+
+    def _frame_wait(self, frame_start: float) -> float:
+        fps = FPS_PLAYING if self.controller.state == State.PLAYING else FPS_IDLE
+        return max(0.0, 1 / fps - (time.monotonic() - frame_start))
 
     def run(self):
         self._running = True
@@ -105,21 +235,16 @@ class TUI:
 
         def _main(stdscr):
             curses.curs_set(0)
-            curses.start_color()
-            curses.use_default_colors()
-            curses.init_pair(1, curses.COLOR_CYAN,    -1)
-            curses.init_pair(2, curses.COLOR_GREEN,   -1)
-            curses.init_pair(3, curses.COLOR_YELLOW,  -1)
-            curses.init_pair(4, curses.COLOR_MAGENTA, -1)
-            curses.init_pair(5, curses.COLOR_WHITE,   -1)
+            self._attr = _init_colors()
             stdscr.nodelay(False)
-            stdscr.timeout(500)
             stdscr.keypad(True)
 
             while self._running:
-                self._update_elapsed()
-                self._curses_draw(stdscr)
+                frame_start = time.monotonic()
+                if self._should_draw():
+                    self._curses_draw(stdscr)
 
+                stdscr.timeout(max(1, int(self._frame_wait(frame_start) * 1000)))
                 key = stdscr.getch()
                 if key == -1:
                     continue
@@ -130,6 +255,7 @@ class TUI:
                 if not _handle_key(ch, self.controller):
                     self._running = False
                     break
+                self.mark_dirty()
 
         curses.wrapper(_main)
 
@@ -142,8 +268,16 @@ class TUI:
 
     def _curses_draw(self, scr):
         import curses
-        scr.erase()
+        attr = self._attr
         h, w = scr.getmaxyx()
+        resized = (h, w) != self._screen_size
+        if resized:
+            # First frame or terminal resized: start again from a blank screen.
+            scr.clear()
+            self._screen_size = (h, w)
+            self._prev_rows = [[] for _ in range(h - 1)]
+        # Each row is a list of (x, text, attr) spans, already cut to fit.
+        rows: list[list[tuple[int, str, int]]] = [[] for _ in range(h - 1)]
         c = self.controller
         meta = c.current_meta
         track = c.current_track
@@ -168,58 +302,48 @@ class TUI:
             web_str = f"  │  http://{host}:{c.cfg.web.port}"
 
         def put(y, x, text, attr=0):
-            if y >= h - 1:
-                return
-            try:
-                scr.addnstr(y, x, str(text), max(0, w - x - 1), attr)
-            except curses.error:
-                pass
+            if y < h - 1 and x < w - 1:
+                rows[y].append((x, text[:w - x - 1], attr))
 
         def div(y):
-            if y >= h - 1:
-                return
-            try:
-                scr.addnstr(y, 0, DIV * w, w, curses.color_pair(5))
-            except curses.error:
-                pass
+            if y < h - 1:
+                rows[y].append((0, DIV * w, attr["text"]))
 
         row = 0
         div(row); row += 1
         put(row, 0, f"  HAZE PLAYOUT  ·  {state_label}{shuffle_str}{web_str}",
-            curses.color_pair(1) | curses.A_BOLD); row += 1
+            attr["header"]); row += 1
         div(row); row += 1
-        put(row, 0, "  " + HELP, curses.color_pair(5)); row += 1
+        put(row, 0, "  " + HELP, attr["text"]); row += 1
         div(row); row += 1
         row += 1
 
-        put(row, 0, "  NOW PLAYING", curses.color_pair(3) | curses.A_BOLD); row += 1
+        put(row, 0, "  NOW PLAYING", attr["section"]); row += 1
         row += 1
 
         title_line = f"  {_trunc(title, w - 12)}"
         put(row, 0, _rjust_pair(title_line, f"{codec}  ", w),
-            curses.color_pair(2) | curses.A_BOLD); row += 1
-        put(row, 2, _trunc(artist, w - 4), curses.color_pair(5)); row += 1
-        put(row, 2, _trunc(album + year, w - 4), curses.color_pair(4)); row += 1
+            attr["title"]); row += 1
+        put(row, 2, _trunc(artist, w - 4), attr["text"]); row += 1
+        put(row, 2, _trunc(album + year, w - 4), attr["album"]); row += 1
         row += 1
         put(row, 0, "  " + _progress_bar(self._elapsed, dur, w - 4),
-            curses.color_pair(1)); row += 1
+            attr["progress"]); row += 1
         row += 1
         div(row); row += 1
         row += 1
 
         pl = c.active_playlist
         if pl and row < h - 4:
-            idx = c._current_index()
-            n = len(pl.tracks)
-            upcoming = [pl.tracks[(idx + i) % n] for i in range(1, min(6, n))]
+            upcoming = c.upcoming(5)
             if upcoming:
                 put(row, 0, f"  NEXT UP  ·  Playlist: \"{pl.name}\"",
-                    curses.color_pair(3)); row += 1
+                    attr["label"]); row += 1
                 row += 1
                 col_w = max(10, (w - 6) // 4)
                 hdr = f"  {'Title':<{col_w}}{'Artist':<{col_w}}{'Album':<{col_w}}{'Length':>8}"
                 put(row, 0, _trunc(hdr, w),
-                    curses.color_pair(5) | curses.A_UNDERLINE); row += 1
+                    attr["table_header"]); row += 1
                 for t in upcoming:
                     if row >= h - 1:
                         break
@@ -227,9 +351,15 @@ class TUI:
                         f"  {_trunc(t.title or t.path.stem, col_w - 1):<{col_w}}"
                         f"{'—':<{col_w}}{'—':<{col_w}}{_fmt_time(t.duration):>8}"
                     )
-                    put(row, 0, _trunc(row_str, w), curses.color_pair(5)); row += 1
+                    put(row, 0, _trunc(row_str, w), attr["text"]); row += 1
 
-        scr.refresh()
+        changed = _flush_rows(scr, rows, self._prev_rows)
+        self._prev_rows = rows
+        if changed or resized:
+            # Stage the window and push it to the terminal in one write; any
+            # future sub-windows would noutrefresh() here too.
+            scr.noutrefresh()
+            curses.doupdate()
 
     # ------------------------------------------------------------------ #
     #  Windows plain-terminal backend                                      #
@@ -238,24 +368,29 @@ class TUI:
     def _run_windows(self):
         import msvcrt
 
+        _enable_vt()
         threading.Thread(target=self._windows_refresh_loop, daemon=True).start()
 
+        wait_for_input = _console_input_waiter(msvcrt)
         while self._running:
             if msvcrt.kbhit():
                 ch = msvcrt.getwch()
                 if not _handle_key(ch, self.controller):
                     self._running = False
                     break
-            time.sleep(0.05)
+                self.mark_dirty()
+                continue
+            wait_for_input()
 
     def _windows_refresh_loop(self):
         while self._running:
+            frame_start = time.monotonic()
             try:
-                self._update_elapsed()
-                self._windows_draw()
+                if self._should_draw():
+                    self._windows_draw()
             except Exception as e:
                 log.debug(f"TUI render error: {e}")
-            time.sleep(0.5)
+            self._dirty.wait(self._frame_wait(frame_start))
 
     def _windows_draw(self):
         c = self.controller
@@ -305,9 +440,7 @@ class TUI:
 
         pl = c.active_playlist
         if pl:
-            idx = c._current_index()
-            n = len(pl.tracks)
-            upcoming = [pl.tracks[(idx + i) % n] for i in range(1, min(6, n))]
+            upcoming = c.upcoming(5)
             if upcoming:
                 col_w = max(10, (w - 6) // 4)
                 lines.append(f"  NEXT UP  ·  Playlist: \"{pl.name}\"")
@@ -322,5 +455,20 @@ class TUI:
                 lines.append("")
                 lines.append(div)
 
-        os.system("cls")
-        print("\n".join(lines), flush=True)
\ No newline at end of file
+        # Repaint only the lines that changed, in place, instead of clearing
+        # the console.
+        out = []
+        prev = self._prev_lines
+        if w != self._prev_width:
+            out.append("\x1b[2J")
+            prev = []
+            self._prev_width = w
+        for y, line in enumerate(lines):
+            if y >= len(prev) or prev[y] != line:
+                out.append(f"\x1b[{y + 1};1H\x1b[2K{line}")
+        if len(lines) < len(prev):
+            out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        self._prev_lines = lines
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
\ No newline at end of file
@@ -1,17 +1,66 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import logging
+import mimetypes
+import os
 import threading
-import time
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
+from .metadata import ART_CACHE_PATH
+
 if TYPE_CHECKING:
     from .controller import Controller
 
 log = logging.getLogger(__name__)
 
+try:
+    from flask import Flask, abort, request, Response, send_file
+    from flask_socketio import SocketIO, emit
+    _FLASK_OK = True
+except ImportError:
+    _FLASK_OK = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _OrjsonCodec:
+    """json-module stand-in for python-socketio, which expects dumps() to return str."""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
 _WEB_DIR = Path(__file__).parent / "web"
+_INDEX_URL = "/index.html"
+
+
+def _load_static(root: Path) -> dict[str, tuple[bytes, Optional[bytes], str, str]]:
+    """Reads every file under web/ once: url path -> (raw, gzipped or None, mimetype, etag)."""
+    assets = {}
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        raw = path.read_bytes()
+        mimetype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        gz = None
+        if mimetype.startswith("text/") or mimetype in ("application/javascript", "application/json", "image/svg+xml"):
+            gz = gzip.compress(raw, 9)
+            if len(gz) >= len(raw):
+                gz = None
+        etag = '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+        assets["/" + path.relative_to(root).as_posix()] = (raw, gz, mimetype, etag)
+    return assets
 
 
 class WebServer:
@@ -21,110 +70,210 @@ class WebServer:
         self.port = port
         self._thread: Optional[threading.Thread] = None
         self._socketio = None
+        # Bumped by the controller on every change; _state_cache holds the
+        # state built for a given version so unchanged state is reused.
+        self._state_version: int = 0
+        self._version_lock = threading.Lock()
+        self._state_cache: Optional[tuple[int, dict]] = None
+        # Connect handlers and the broadcaster can both build state; only one
+        # builds at a time.
+        self._build_lock = threading.Lock()
+        # Playlist entries for the state payload, rebuilt only when the
+        # controller swaps in a new playlists dict (i.e. on reload). Lists
+        # already handed out in a state are never modified afterwards.
+        self._playlists_source: Optional[dict] = None
+        self._playlists_list: list[dict] = []
+        self._playlists_index: dict[str, int] = {}
+        self._playlists_active: Optional[str] = None
 
     def start(self):
+        if not _FLASK_OK:
+            log.error("Flask or flask-socketio not installed — run: pip install flask flask-socketio")
+            return
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         log.info(f"Web UI starting on http://{self.host}:{self.port}")
 
     def _run(self):
-        try:
-            from flask import Flask, abort, Response
-            from flask_socketio import SocketIO, emit
-        except ImportError:
-            log.error("Flask or flask-socketio not installed — run: pip install flask flask-socketio")
-            return
-
         app = Flask(__name__, static_folder=None)
         app.config["SECRET_KEY"] = "haze-playout"
-        socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+        # orjson is optional; without it Socket.IO uses the stdlib codec.
+        codec = {"json": _OrjsonCodec} if orjson else {}
+        # Only applies to HTTP long-polling responses (before or instead of
+        # a websocket upgrade); websocket frames are sent uncompressed.
+        # Lowered from engineio's 1 KiB so polled state packets qualify.
+        socketio = SocketIO(
+            app,
+            cors_allowed_origins="*",
+            async_mode="threading",
+            compression_threshold=512,
+            # Clients only ever send small action messages, so cap inbound
+            # packets well below engineio's 1 MB default.
+            max_http_buffer_size=4096,
+            ping_interval=15,
+            ping_timeout=20,
+            **codec,
+        )
         self._socketio = socketio
 
-        @app.route("/")
-        @app.route("/index.html")
-        def index():
-            path = _WEB_DIR / "index.html"
-            if not path.exists():
-                return f"index.html not found at {path}", 404
-            return Response(path.read_bytes(), mimetype="text/html; charset=utf-8")
+        # The web UI doesn't change while we run, so read (and compress)
+        # everything under web/ once and serve it from memory.
+        try:
+            assets = _load_static(_WEB_DIR)
+        except OSError as e:
+            log.error(f"Could not load web assets from {_WEB_DIR}: {e}")
+            assets = {}
+
+        def serve_asset(name: str):
+            entry = assets.get(name)
+            if entry is None:
+                return None
+            raw, gz, mimetype, etag = entry
+            headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+            if etag in request.headers.get("If-None-Match", ""):
+                return Response(status=304, headers=headers)
+            if gz is not None and "gzip" in request.headers.get("Accept-Encoding", ""):
+                headers["Content-Encoding"] = "gzip"
+                return Response(gz, mimetype=mimetype, headers=headers)
+            return Response(raw, mimetype=mimetype, headers=headers)
+
+        # Whether the page exists is settled at startup, not per request.
+        if _INDEX_URL in assets:
+            @app.route("/")
+            def index():
+                return serve_asset(_INDEX_URL)
+        else:
+            log.warning(f"index.html not found in {_WEB_DIR}; the web UI will return 404")
+
+            @app.route("/")
+            def index():
+                return f"index.html not found in {_WEB_DIR}", 404
+
+        @app.route("/<path:name>")
+        def static_asset(name):
+            return serve_asset("/" + name) or abort(404)
+
+        # Absolute, since send_file resolves relative paths against the app
+        # root rather than the working directory save_art() writes to.
+        art_path = Path(os.path.abspath(ART_CACHE_PATH))
 
         @app.route("/art")
         def art():
-            art_path = Path("now_playing_art.jpg")
-            
-            attempts = 0
-            while not art_path.exists() and attempts < 5:
-                time.sleep(0.1)
-                attempts += 1
-
+            if not art_path.exists():
+                # Possibly mid track change: wait for the controller to
+                # finish saving this track's art rather than polling.
+                self.controller.art_ready.wait(timeout=0.5)
             if not art_path.exists():
                 abort(404)
-            
+
+            # Streamed from the file (sendfile where the server supports it)
+            # rather than read into memory. save_art() replaces the file
+            # atomically, so an open response keeps reading the old image.
+            # The ETag follows the file's mtime and size, so a client that
+            # revalidates unchanged art gets a bodiless 304.
             try:
-                data = art_path.read_bytes()
-                return Response(data, mimetype="image/jpeg", headers={"Cache-Control": "no-cache, no-store, must-revalidate"})
-            except Exception:
+                resp = send_file(art_path, mimetype="image/jpeg", conditional=True, etag=True, max_age=0)
+            except OSError:
                 abort(503)
+            resp.headers["Cache-Control"] = "no-cache"
+            return resp
 
         @socketio.on("connect")
         def on_connect():
             log.info("WebSocket client connected")
-            emit("state", self._build_state())
+            emit("state", self._get_state())
+
+        c = self.controller
+        actions = {
+            "play": lambda d: c.resume(),
+            "pause": lambda d: c.pause(),
+            "next": lambda d: c.next_track(),
+            "prev": lambda d: c.prev_track(),
+            "toggle_shuffle": lambda d: c.toggle_shuffle(),
+            "switch": lambda d: d.get("playlist") and c.switch_to(d["playlist"]),
+        }
 
         @socketio.on("action")
         def on_action(data):
             if not isinstance(data, dict):
                 return
             action = data.get("action")
-            c = self.controller
-
-            if action == "play":
-                c.resume()
-            elif action == "pause":
-                c.pause()
-            elif action == "next":
-                c.next_track()
-            elif action == "prev":
-                c.prev_track()
-            elif action == "toggle_shuffle":
-                c.toggle_shuffle()
-            elif action == "switch":
-                name = data.get("playlist")
-                if name:
-                    c.switch_to(name)
-
-            socketio.emit("state", self._build_state())
+            handler = actions.get(action) if isinstance(action, str) else None
+            if handler:
+                handler(data)
+            # No emit here: the controller applies commands asynchronously
+            # and broadcasts the resulting state itself, coalesced with any
+            # other changes in the same window.
 
         socketio.run(app, host=self.host, port=self.port, use_reloader=False, log_output=False)
 
     def broadcast_track_change(self):
-        self._emit("track_change", self._build_state())
+        self._emit("track_change", self._get_state())
 
     def broadcast_state_change(self):
-        self._emit("state", self._build_state())
+        self._emit("state", self._get_state())
+
+    def invalidate_state(self):
+        # Callers may be on different threads, and an unlocked += can lose
+        # one of two concurrent bumps.
+        with self._version_lock:
+            self._state_version += 1
 
     def _emit(self, event: str, data: dict):
         if self._socketio is None:
             return
+        # Straight to the python-socketio server: a broadcast from outside a
+        # request needs none of Flask-SocketIO's request-context handling,
+        # and the packet is encoded once for all clients.
         try:
-            self._socketio.emit(event, data)
-        except Exception as e:
+            self._socketio.server.emit(event, data, namespace="/")
+        except (ConnectionError, RuntimeError) as e:
             log.debug(f"SocketIO emit error: {e}")
 
+    def _get_state(self) -> dict:
+        with self._build_lock:
+            version = self._state_version
+            cached = self._state_cache
+            if cached and cached[0] == version:
+                return cached[1]
+            # Tagged with the version read before building, so a change that
+            # lands mid-build still forces a rebuild next time.
+            state = self._build_state()
+            self._state_cache = (version, state)
+            return state
+
+    def _playlists_payload(self, active: Optional[str]) -> list[dict]:
+        source = self.controller.playlists
+        if source is not self._playlists_source:
+            self._playlists_list = [
+                {
+                    "name": name,
+                    "track_count": len(pl),
+                    "transition": pl.transition or "finish_track",
+                    "active": name == active,
+                }
+                for name, pl in source.items()
+            ]
+            self._playlists_index = {e["name"]: i for i, e in enumerate(self._playlists_list)}
+            self._playlists_source = source
+        elif active != self._playlists_active:
+            # A switch only replaces the two entries whose active flag moved;
+            # the rest are shared with the previous list.
+            entries = self._playlists_list.copy()
+            for name, flag in ((self._playlists_active, False), (active, True)):
+                i = self._playlists_index.get(name)
+                if i is not None:
+                    entries[i] = {**entries[i], "active": flag}
+            self._playlists_list = entries
+        self._playlists_active = active
+        return self._playlists_list
+
     def _build_state(self) -> dict:
         c = self.controller
         meta = c.current_meta
         track = c.current_track
 
-        playlists = [
-            {
-                "name": name,
-                "track_count": len(pl),
-                "transition": pl.transition or "finish_track",
-                "active": bool(c.active_playlist and c.active_playlist.name == name),
-            }
-            for name, pl in c.playlists.items()
-        ]
+        playlists = self._playlists_payload(c.active_playlist.name if c.active_playlist else None)
 
         return {
             "state": c.state.name,
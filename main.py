@@ -2,13 +2,20 @@ import logging
 import os
 import sys
 import argparse
+import select
+import signal
+import socket
 from pathlib import Path
-import time
+
+from typing import TYPE_CHECKING
 
 from haze.config import load
-from haze.controller import Controller
-from haze.tui import TUI
-from haze.webserver import WebServer
+
+# The rest of the package (and Flask, curses, sounddevice behind it) is
+# imported only by the code paths that use it, so --list-devices and
+# --list-playlists start quickly.
+if TYPE_CHECKING:
+    from haze.tui import TUI
 
 logging.basicConfig(
     filename="haze.log",
@@ -45,20 +52,24 @@ def main(
             )
         return
 
-    controller = Controller(cfg)
-    controller.load_playlists()
-
     if list_playlists:
-        for name in controller.playlists.keys():
+        from haze.playlist import discover
+        for name in discover(cfg).keys():
             print(name)
         return
 
+    from haze.controller import Controller
+    controller = Controller(cfg)
+    controller.load_playlists()
+
     tui: TUI | None = None
     if not no_tui:
+        from haze.tui import TUI
         tui = TUI(controller)
         controller.set_tui(tui)
 
     if cfg.web.enabled:
+        from haze.webserver import WebServer
         webserver = WebServer(controller, host=cfg.web.host, port=cfg.web.port)
         controller.set_webserver(webserver)
         webserver.start()
@@ -69,9 +80,29 @@ def main(
         if tui:
             tui.run()
         else:
-            
-            while True:
-                time.sleep(1)
+            # The handler only sets a flag: taking a lock there (e.g. via
+            # Event.set) could deadlock against the interrupted main thread.
+            # The wakeup socket gets a byte from C as soon as a signal lands,
+            # so one that arrives before select() still wakes it.
+            stopping = False
+
+            def request_stop(*_):
+                nonlocal stopping
+                stopping = True
+
+            wake_r, wake_w = socket.socketpair()
+            wake_w.setblocking(False)
+            signal.set_wakeup_fd(wake_w.fileno())
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, request_stop)
+            try:
+                while not stopping:
+                    select.select([wake_r], [], [])
+                    wake_r.recv(64)
+            finally:
+                signal.set_wakeup_fd(-1)
+                wake_r.close()
+                wake_w.close()
     except KeyboardInterrupt:
         pass
     finally: